@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from typing import Any
 
 from pysmartthings import (
@@ -30,7 +31,7 @@ class SmartThingsEntity(Entity):
         self,
         client: SmartThings,
         device: FullDevice,
-        capabilities: set[Capability],
+        capabilities: AbstractSet[Capability],
         *,
         component: str = MAIN,
     ) -> None: